@@ -286,6 +286,28 @@ class PerformanceValidator:
             ]
         }
 
+class RunningStats:
+    """Running mean and sample standard deviation (Welford), O(1) memory."""
+    
+    __slots__ = ("count", "mean", "_m2")
+    
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+    
+    def add(self, x: float):
+        """Add one sample."""
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+    
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation; 0.0 for fewer than two samples."""
+        return (self._m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
 class MemoryProfiler:
     """Profiles memory usage of recovery system."""
     
@@ -5,6 +5,7 @@ Validates all performance requirements and generates detailed report.
 """
 
 import asyncio
+import functools
 import time
 import statistics
 import json
@@ -26,6 +27,35 @@ except ImportError as e:
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _score(
+    overhead_avg: Optional[float],
+    success_rate: Optional[float],
+    fail_ratio: Optional[float],
+    max_overhead: float,
+    min_success_rate: float
+) -> float:
+    """Calculate overall performance score (0-100) from precomputed aggregates.
+
+    ``None`` means the corresponding aggregate is unavailable and carries no penalty.
+    """
+    score = 100.0
+    
+    # Penalize for overhead
+    if overhead_avg is not None:
+        score -= min(50, max(0, (overhead_avg - max_overhead) * 10))
+    
+    # Penalize for low success rate
+    if success_rate is not None:
+        score -= max(0, (min_success_rate - success_rate) * 2)
+    
+    # Penalize for failed tests
+    if fail_ratio is not None:
+        score -= fail_ratio * 25
+    
+    return max(0, min(100, score))
+
+
 class FinalPerformanceValidator:
     """Final comprehensive performance validation."""
     
@@ -336,14 +366,30 @@ class FinalPerformanceValidator:
     
     def _generate_final_report(self, validation_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate final comprehensive report."""
-        # Calculate overall metrics
+        # Aggregate every metric in a single pass; skipped tests stay out of
+        # the score but still show in the summary
         total_tests = len(validation_results)
-        passed_tests = len([r for r in validation_results.values() if r.get("status") == "PASS"])
-        skipped_tests = len([r for r in validation_results.values() if r.get("status") == "SKIP"])
+        passed_tests = 0
+        skipped_tests = 0
+        failed_count = 0
+        overhead_percentages = []
+        scored_overheads = []
+        for r in validation_results.values():
+            status = r.get("status")
+            overhead = r.get("overhead_percent")
+            if overhead is not None:
+                overhead_percentages.append(overhead)
+            if status == "SKIP":
+                skipped_tests += 1
+                continue
+            if status == "PASS":
+                passed_tests += 1
+            elif status == "FAIL":
+                failed_count += 1
+            if overhead is not None:
+                scored_overheads.append(overhead)
+        scored_count = total_tests - skipped_tests
         
-        # Extract overhead percentages
-        overhead_tests = [r for r in validation_results.values() if "overhead_percent" in r]
-        overhead_percentages = [r["overhead_percent"] for r in overhead_tests]
         avg_overhead = statistics.mean(overhead_percentages) if overhead_percentages else 0
         max_overhead = max(overhead_percentages) if overhead_percentages else 0
         
@@ -351,8 +397,17 @@ class FinalPerformanceValidator:
         recovery_test = validation_results.get("recovery_performance", {})
         success_rate = recovery_test.get("success_rate_percent", 0)
         
-        # Calculate overall score
-        overall_score = self._calculate_overall_score(validation_results)
+        scored_success_rate = None
+        if recovery_test and recovery_test.get("status") != "SKIP":
+            scored_success_rate = success_rate
+        
+        overall_score = _score(
+            statistics.mean(scored_overheads) if scored_overheads else None,
+            scored_success_rate,
+            failed_count / scored_count if scored_count > 0 else None,
+            self.requirements["max_overhead_percent"],
+            self.requirements["min_success_rate_percent"]
+        )
         
         # Determine overall status
         overhead_ok = avg_overhead <= self.requirements["max_overhead_percent"]
@@ -389,34 +444,9 @@ class FinalPerformanceValidator:
             }
         }
     
-    def _calculate_overall_score(self, results: Dict[str, Any]) -> float:
-        """Calculate overall performance score (0-100)."""
-        score = 100.0
-        
-        # Penalize for overhead
-        overhead_tests = [r for r in results.values() if "overhead_percent" in r and r.get("status") != "SKIP"]
-        if overhead_tests:
-            avg_overhead = statistics.mean([r["overhead_percent"] for r in overhead_tests])
-            overhead_penalty = min(50, max(0, (avg_overhead - self.requirements["max_overhead_percent"]) * 10))
-            score -= overhead_penalty
-        
-        # Penalize for low success rate
-        recovery_test = results.get("recovery_performance", {})
-        if recovery_test and recovery_test.get("status") != "SKIP":
-            success_rate = recovery_test.get("success_rate_percent", 0)
-            success_penalty = max(0, (self.requirements["min_success_rate_percent"] - success_rate) * 2)
-            score -= success_penalty
-        
-        # Penalize for failed tests
-        failed_tests = len([r for r in results.values() if r.get("status") == "FAIL"])
-        total_tests = len([r for r in results.values() if r.get("status") != "SKIP"])
-        if total_tests > 0:
-            failure_penalty = (failed_tests / total_tests) * 25
-            score -= failure_penalty
-        
-        return max(0, min(100, score))
-    
-    def _get_grade(self, score: float) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_grade(score: float) -> str:
         """Get performance grade based on score."""
         if score >= 90:
             return "Excellent"
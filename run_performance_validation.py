@@ -13,6 +13,8 @@ import json
 from datetime import datetime, timezone
 from typing import Dict, List, Any
 
+import numpy as np
+
 # Add the backend directory to the Python path
 sys.path.insert(0, '/home/crogers2287/comfy/ComfyUI-Launcher/worktrees/issue-8/backend/src')
 sys.path.insert(0, '/home/crogers2287/comfy/ComfyUI-Launcher/worktrees/issue-8/backend/tests')
@@ -20,7 +22,7 @@ sys.path.insert(0, '/home/crogers2287/comfy/ComfyUI-Launcher/worktrees/issue-8/b
 
 try:
     # Import recovery components
-    from recovery.performance import PerformanceValidator, validate_recovery_performance
+    from recovery.performance import PerformanceValidator, RunningStats, validate_recovery_performance
     from recovery import recoverable, RecoveryConfig
     print("✓ Recovery modules imported successfully")
 except ImportError as e:
@@ -28,6 +30,24 @@ except ImportError as e:
     sys.exit(1)
 
 
+@recoverable(max_retries=2)
+async def _checkpoint_operation(operation_id: int):
+    """Checkpoint benchmark fixture; decorated once at import."""
+    # Simulate operation with checkpointing
+    await asyncio.sleep(0.01)
+    return {"operation_id": operation_id, "status": "success"}
+
+
+@recoverable(max_retries=3, initial_delay=0.01)
+async def _recoverable_operation(operation_id: int, failure_rate: float):
+    """Recovery benchmark fixture; fails deterministically for ``failure_rate`` of ids."""
+    if operation_id % 10 < failure_rate * 10:
+        raise ConnectionError(f"Simulated failure {operation_id}")
+    
+    await asyncio.sleep(0.02)
+    return {"operation_id": operation_id, "status": "success"}
+
+
 class SimplePerformanceBenchmark:
     """Simple performance benchmark without external dependencies."""
     
@@ -40,22 +60,22 @@ class SimplePerformanceBenchmark:
         print(f"Running overhead benchmark with {iterations} iterations...")
         
         # Baseline operation without recovery
-        baseline_times = []
+        baseline_times = np.empty(iterations, dtype=np.float64)
         for i in range(iterations):
             start = time.perf_counter()
             await self._baseline_operation(i)
-            baseline_times.append(time.perf_counter() - start)
+            baseline_times[i] = time.perf_counter() - start
         
         # Operation with recovery (no retries)
-        recovery_times = []
+        recovery_times = np.empty(iterations, dtype=np.float64)
         for i in range(iterations):
             start = time.perf_counter()
             await self._recovery_operation(i)
-            recovery_times.append(time.perf_counter() - start)
+            recovery_times[i] = time.perf_counter() - start
         
         # Calculate metrics
-        baseline_avg = statistics.mean(baseline_times)
-        recovery_avg = statistics.mean(recovery_times)
+        baseline_avg = float(baseline_times.mean())
+        recovery_avg = float(recovery_times.mean())
         overhead_percent = ((recovery_avg - baseline_avg) / baseline_avg) * 100
         
         return {
@@ -81,60 +101,53 @@ class SimplePerformanceBenchmark:
         """Test checkpoint write performance."""
         print(f"Testing checkpoint performance with {iterations} iterations...")
         
-        checkpoint_times = []
-        
-        @recoverable(max_retries=2, checkpoint_interval=1)
-        async def checkpoint_operation(operation_id: int):
-            # Simulate operation with checkpointing
-            await asyncio.sleep(0.01)
-            return {"operation_id": operation_id, "status": "success"}
+        stats = RunningStats()
         
         for i in range(iterations):
             start = time.perf_counter()
             try:
-                result = await checkpoint_operation(i)
+                result = await _checkpoint_operation(i)
             except Exception:
                 pass  # Continue even if operation fails
-            checkpoint_times.append(time.perf_counter() - start)
+            stats.add(time.perf_counter() - start)
         
-        avg_checkpoint_time = statistics.mean(checkpoint_times)
+        avg_checkpoint_time = stats.mean
+        stdev_checkpoint_time = stats.stdev
         
         return {
             "avg_checkpoint_time_ms": avg_checkpoint_time * 1000,
+            "stdev_checkpoint_time_ms": stdev_checkpoint_time * 1000,
             "total_operations": iterations,
             "checkpoint_time_target_met": avg_checkpoint_time < 0.1  # < 100ms
         }
     
-    async def test_recovery_time_performance(self, iterations: int = 30) -> Dict[str, Any]:
+    async def test_recovery_time_performance(
+        self,
+        iterations: int = 30,
+        failure_rate: float = 0.3
+    ) -> Dict[str, Any]:
         """Test recovery time performance."""
         print(f"Testing recovery time performance with {iterations} iterations...")
         
-        recovery_times = []
+        stats = RunningStats()
         success_count = 0
         
-        @recoverable(max_retries=3, initial_delay=0.01)
-        async def recoverable_operation(operation_id: int):
-            # Simulate failure 30% of the time
-            if operation_id % 10 < 3:  # 30% failure rate
-                raise ConnectionError(f"Simulated failure {operation_id}")
-            
-            await asyncio.sleep(0.02)
-            return {"operation_id": operation_id, "status": "success"}
-        
         for i in range(iterations):
             start = time.perf_counter()
             try:
-                result = await recoverable_operation(i)
+                result = await _recoverable_operation(i, failure_rate)
                 success_count += 1
             except Exception:
                 pass  # Expected failures
-            recovery_times.append(time.perf_counter() - start)
+            stats.add(time.perf_counter() - start)
         
-        avg_recovery_time = statistics.mean(recovery_times)
+        avg_recovery_time = stats.mean
+        stdev_recovery_time = stats.stdev
         success_rate = (success_count / iterations) * 100
         
         return {
             "avg_recovery_time_ms": avg_recovery_time * 1000,
+            "stdev_recovery_time_ms": stdev_recovery_time * 1000,
             "success_rate_percent": success_rate,
             "total_operations": iterations,
             "successful_operations": success_count,
@@ -21,33 +21,103 @@ Usage:
 
 import asyncio
 import argparse
+import importlib
 import sys
 import os
 import time
 import json
-import subprocess
+import tempfile
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import pytest
+from types import MappingProxyType
+from typing import List, Dict, Any, Iterator, Optional
 import multiprocessing
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-# Import test modules
-from backend.tests.recovery.test_comprehensive_recovery import *
-from backend.tests.recovery.test_integration_scenarios import *
-from backend.tests.recovery.test_end_to_end_scenarios import *
-from backend.tests.recovery.test_performance_benchmarks import *
+# Suite modules are imported lazily by the category that needs them
+
+
+@lru_cache(maxsize=None)
+def _load_config_file(path: str) -> MappingProxyType:
+    """Read a JSON config file once per path; the result is shared read-only."""
+    with open(path, 'r') as f:
+        return MappingProxyType(json.load(f))
+
+
+def _count_report_log(path: Path) -> tuple:
+    """Return (passed, failed) test counts from a pytest-reportlog file.
+    
+    A test counts as failed when any phase fails, so setup and teardown
+    errors are included; it counts as passed when its call phase passed.
+    """
+    outcomes: Dict[str, str] = {}
+    if path.exists():
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(path, 'rb') as f:
+            for line in f:
+                entry = loads(line)
+                if entry.get("$report_type") != "TestReport":
+                    continue
+                if entry["outcome"] == "failed":
+                    outcomes[entry["nodeid"]] = "failed"
+                elif entry["when"] == "call" and entry["outcome"] == "passed":
+                    outcomes.setdefault(entry["nodeid"], "passed")
+    
+    failed = sum(1 for outcome in outcomes.values() if outcome == "failed")
+    return len(outcomes) - failed, failed
+
+
+@dataclass(slots=True)
+class SummaryAcc:
+    """Running summary totals, updated as each test category finishes."""
+    total: int = 0
+    passed: int = 0
+    ok_cats: int = 0
+    total_cats: int = 0
+    total_time: float = 0.0
+    peak_bytes: Optional[int] = None
+    
+    def add(self, result: Dict[str, Any]):
+        """Fold one category result into the totals."""
+        success = result.get("success", False)
+        self.total_cats += 1
+        if success:
+            self.ok_cats += 1
+        
+        if "test_count" in result:
+            self.total += result["test_count"]
+            if success:
+                self.passed += result["test_count"]
+        elif "total_tests" in result:
+            self.total += result["total_tests"]
+            self.passed += result.get("passed_tests", 0)
+        
+        self.total_time += result.get("execution_time", 0)
+        peak = result.get("peak_bytes")
+        if peak is not None and (self.peak_bytes is None or peak > self.peak_bytes):
+            self.peak_bytes = peak
 
 
 class TestRunner:
     """Main test runner for recovery system tests."""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.results = {}
+        self.verbose = verbose
+        self._trace_depth = 0
         self.config = self._load_config()
         self.report_dir = Path(self.config.get("report_dir", "test_reports"))
         self.report_dir.mkdir(exist_ok=True)
@@ -60,59 +130,54 @@ class TestRunner:
             "report_dir": "test_reports",
             "performance_samples": 100,
             "load_test_duration": 30,
-            "enable_memory_profiling": True,
+            "enable_memory_profiling": False,
             "log_level": "INFO"
         }
         
         config_path = Path("test_config.json")
         if config_path.exists():
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-                default_config.update(user_config)
+            default_config.update(_load_config_file(str(config_path)))
         
         return default_config
     
-    async def run_all_tests(self) -> Dict[str, Any]:
-        """Run all test suites."""
+    async def run_all_tests(self, save_report: bool = False) -> Dict[str, Any]:
+        """Run all test suites, saving the detailed report when requested."""
         print("🚀 Starting Comprehensive Recovery Test Suite")
         print("=" * 60)
         
         start_time = time.time()
-        all_results = {}
         
         # Run different test categories
         test_categories = [
             ("Unit Tests", self._run_unit_tests),
             ("Integration Tests", self._run_integration_tests),
-            ("End-to-End Tests", self._run_e2e_tests),
-            ("Performance Tests", self._run_performance_tests)
+            ("End-to-End Tests", self._run_e2e_tests)
         ]
         
-        for category_name, test_func in test_categories:
-            print(f"\n📋 Running {category_name}")
-            print("-" * 40)
-            
-            try:
-                result = await test_func()
-                all_results[category_name] = result
-                
-                status = "✅ PASSED" if result.get("success", False) else "❌ FAILED"
-                print(f"{category_name}: {status}")
-                
-                if not result.get("success", False):
-                    print(f"   Error: {result.get('error', 'Unknown error')}")
-                    
-            except Exception as e:
-                print(f"❌ {category_name} failed with error: {e}")
-                all_results[category_name] = {
-                    "success": False,
-                    "error": str(e),
-                    "execution_time": 0
-                }
+        # These categories share no state, so run them concurrently
+        print(f"\n📋 Running {', '.join(name for name, _ in test_categories)}")
+        print("-" * 40)
+        acc = SummaryAcc()
+        results = await asyncio.gather(*(
+            self._run_category(acc, category_name, test_func)
+            for category_name, test_func in test_categories
+        ))
+        all_results = {
+            category_name: result
+            for (category_name, _), result in zip(test_categories, results)
+        }
+        
+        # Performance benchmarks run alone: they manage tracemalloc themselves
+        # and their timings must not share the loop with other suites
+        print("\n📋 Running Performance Tests")
+        print("-" * 40)
+        all_results["Performance Tests"] = await self._run_category(
+            acc, "Performance Tests", self._run_performance_tests
+        )
         
-        # Generate summary report
-        total_time = time.time() - start_time
-        summary = self._generate_summary(all_results, total_time)
+        # Generate summary report; report wall-clock time, not the suite sum
+        acc.total_time = time.time() - start_time
+        summary = self._generate_summary(acc, all_results)
         
         print("\n" + "=" * 60)
         print("📊 Test Execution Summary")
@@ -120,34 +185,101 @@ class TestRunner:
         self._print_summary(summary)
         
         # Save detailed report
-        await self._save_report(all_results, summary)
+        if save_report:
+            await self._save_report(all_results, summary)
         
         return summary
     
+    async def _run_category(self, acc: "SummaryAcc", category_name: str,
+                            test_func) -> Dict[str, Any]:
+        """Run one test category and report its status as soon as it finishes."""
+        try:
+            result = await test_func()
+        except Exception as e:
+            print(f"❌ {category_name} failed with error: {e}")
+            result = {
+                "success": False,
+                "error": str(e),
+                "execution_time": 0
+            }
+            acc.add(result)
+            return result
+        
+        acc.add(result)
+        status = "✅ PASSED" if result.get("success", False) else "❌ FAILED"
+        print(f"{category_name}: {status}")
+        
+        if not result.get("success", False):
+            print(f"   Error: {result.get('error', 'Unknown error')}")
+        
+        return result
+    
+    @contextmanager
+    def _maybe_trace(self) -> Iterator[Dict[str, Any]]:
+        """Trace allocations for one suite when enable_memory_profiling is set.
+        
+        Yields a dict that receives ``peak_bytes`` on exit (``None`` when disabled).
+        Tracing is process-wide, so suites running concurrently share one
+        tracing session and report the peak observed while they overlapped.
+        """
+        trace: Dict[str, Any] = {"peak_bytes": None}
+        if not self.config["enable_memory_profiling"]:
+            yield trace
+            return
+        
+        if self._trace_depth == 0:
+            tracemalloc.start()
+        self._trace_depth += 1
+        try:
+            yield trace
+        finally:
+            _, trace["peak_bytes"] = tracemalloc.get_traced_memory()
+            self._trace_depth -= 1
+            if self._trace_depth == 0:
+                tracemalloc.stop()
+    
     async def _run_unit_tests(self) -> Dict[str, Any]:
         """Run unit tests for recovery system."""
         start_time = time.time()
         
         try:
-            # Run pytest for unit tests
-            result = subprocess.run([
-                "python", "-m", "pytest",
-                "backend/tests/recovery/test_comprehensive_recovery.py",
-                "-v", "--tb=short",
-                f"--timeout={self.config['test_timeout']}"
-            ], capture_output=True, text=True, cwd=project_root)
+            # Outcomes come from pytest-reportlog's JSONL, kept in a temporary
+            # directory, instead of scraping the console log; the log goes
+            # straight to a file and is referenced by path rather than copied
+            # into the report
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            log_path = (self.report_dir / f"unit_{timestamp}.log").resolve()
             
-            success = result.returncode == 0
+            with tempfile.TemporaryDirectory() as tmp_dir, open(log_path, "wb") as log_file:
+                report_log = Path(tmp_dir) / "unit.jsonl"
+                proc = await asyncio.create_subprocess_exec(
+                    sys.executable, "-m", "pytest",
+                    "backend/tests/recovery/test_comprehensive_recovery.py",
+                    "--tb=short",
+                    # --verbose lists each test in the unit log
+                    *(["-v"] if self.verbose else []),
+                    f"--timeout={self.config['test_timeout']}",
+                    # Distribute test items across worker processes (pytest-xdist)
+                    "-n", str(self.config["parallel_workers"]),
+                    "--dist=load",
+                    f"--report-log={report_log}",
+                    stdout=log_file,
+                    stderr=asyncio.subprocess.STDOUT,
+                    cwd=project_root
+                )
+                rc = await proc.wait()
+                passed, failed = _count_report_log(report_log)
             
-            # Parse results
-            test_count = self._parse_pytest_output(result.stdout)
+            success = rc == 0
             
             return {
                 "success": success,
-                "test_count": test_count,
+                "test_count": passed + failed,
+                "passed_tests": passed,
+                "failed_tests": failed,
                 "execution_time": time.time() - start_time,
-                "output": result.stdout,
-                "error": result.stderr if not success else None
+                "output_path": str(log_path),
+                "error": f"pytest exited with code {rc}" if not success else None
             }
             
         except Exception as e:
@@ -163,9 +295,12 @@ class TestRunner:
         
         try:
             # Run integration test scenarios
-            results = await run_comprehensive_integration_tests()
+            mod = importlib.import_module("backend.tests.recovery.test_integration_scenarios")
+            with self._maybe_trace() as trace:
+                results = await mod.run_comprehensive_integration_tests()
             
             return {
+                "peak_bytes": trace["peak_bytes"],
                 "success": results.get("success_rate", 0) >= 80.0,
                 "success_rate": results.get("success_rate", 0),
                 "total_tests": results.get("total_tests", 0),
@@ -187,9 +322,12 @@ class TestRunner:
         
         try:
             # Run E2E test scenarios
-            results = await run_comprehensive_e2e_tests()
+            mod = importlib.import_module("backend.tests.recovery.test_end_to_end_scenarios")
+            with self._maybe_trace() as trace:
+                results = await mod.run_comprehensive_e2e_tests()
             
             return {
+                "peak_bytes": trace["peak_bytes"],
                 "success": results.get("success_rate", 0) >= 75.0,
                 "success_rate": results.get("success_rate", 0),
                 "total_tests": results.get("total_tests", 0),
@@ -210,14 +348,18 @@ class TestRunner:
         start_time = time.time()
         
         try:
-            # Run performance tests
-            results = await run_comprehensive_performance_tests()
+            # Run performance tests. Not wrapped in _maybe_trace: the suite's
+            # MemoryProfiler starts and stops tracemalloc itself, which would end
+            # an outer tracing session and zero its peak
+            mod = importlib.import_module("backend.tests.recovery.test_performance_benchmarks")
+            results = await mod.run_comprehensive_performance_tests()
             
             # Determine success based on performance thresholds
             overall_score = results.get("summary", {}).get("overall_score", 0)
             success = overall_score >= 70.0  # 70% minimum score
             
             return {
+                "peak_bytes": None,  # self-managed by the suite's MemoryProfiler
                 "success": success,
                 "overall_score": overall_score,
                 "performance_grade": results.get("summary", {}).get("overall_grade", "Unknown"),
@@ -232,48 +374,22 @@ class TestRunner:
                 "execution_time": time.time() - start_time
             }
     
-    def _parse_pytest_output(self, output: str) -> int:
-        """Parse pytest output to extract test count."""
-        lines = output.split('\n')
-        for line in lines:
-            if 'collected' in line and 'items' in line:
-                try:
-                    return int(line.split()[1])
-                except:
-                    continue
-        return 0
-    
-    def _generate_summary(self, results: Dict[str, Any], total_time: float) -> Dict[str, Any]:
-        """Generate test execution summary."""
-        total_tests = 0
-        passed_tests = 0
-        successful_categories = 0
-        
-        for category, result in results.items():
-            if result.get("success", False):
-                successful_categories += 1
-            
-            if "test_count" in result:
-                total_tests += result["test_count"]
-                if result["success"]:
-                    passed_tests += result["test_count"]
-            elif "total_tests" in result:
-                total_tests += result["total_tests"]
-                passed_tests += result.get("passed_tests", 0)
-        
-        success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
-        category_success_rate = (successful_categories / len(results) * 100) if results else 0
+    def _generate_summary(self, acc: "SummaryAcc", results: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate test execution summary from the accumulated totals."""
+        success_rate = (acc.passed / acc.total * 100) if acc.total > 0 else 0
+        category_success_rate = (acc.ok_cats / acc.total_cats * 100) if acc.total_cats else 0
         
         return {
-            "total_tests": total_tests,
-            "passed_tests": passed_tests,
-            "failed_tests": total_tests - passed_tests,
+            "total_tests": acc.total,
+            "passed_tests": acc.passed,
+            "failed_tests": acc.total - acc.passed,
             "success_rate": success_rate,
             "category_success_rate": category_success_rate,
-            "successful_categories": successful_categories,
-            "total_categories": len(results),
-            "total_execution_time": total_time,
-            "average_test_time": total_time / total_tests if total_tests > 0 else 0,
+            "successful_categories": acc.ok_cats,
+            "total_categories": acc.total_cats,
+            "total_execution_time": acc.total_time,
+            "average_test_time": acc.total_time / acc.total if acc.total > 0 else 0,
+            "peak_memory_bytes": acc.peak_bytes,
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "detailed_results": results
         }
@@ -296,7 +412,10 @@ class TestRunner:
     
     async def _save_report(self, results: Dict[str, Any], summary: Dict[str, Any]):
         """Save detailed test report."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # One clock read for the file names and both "generated" stamps
+        now = datetime.now(timezone.utc)
+        local_now = now.astimezone()
+        timestamp = local_now.strftime("%Y%m%d_%H%M%S")
         report_file = self.report_dir / f"recovery_test_report_{timestamp}.json"
         summary_file = self.report_dir / f"test_summary_{timestamp}.txt"
         
@@ -304,32 +423,59 @@ class TestRunner:
         full_report = {
             "summary": summary,
             "detailed_results": results,
-            "configuration": self.config,
-            "generated_at": datetime.now(timezone.utc).isoformat()
+            "configuration": dict(self.config),
+            "generated_at": now.isoformat()
         }
         
-        with open(report_file, 'w') as f:
-            json.dump(full_report, f, indent=2)
-        
-        # Save human-readable summary
-        with open(summary_file, 'w') as f:
-            f.write("ComfyUI Launcher Recovery Test Summary\n")
-            f.write("=" * 50 + "\n\n")
-            f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total Tests: {summary['total_tests']}\n")
-            f.write(f"Passed Tests: {summary['passed_tests']}\n")
-            f.write(f"Failed Tests: {summary['failed_tests']}\n")
-            f.write(f"Success Rate: {summary['success_rate']:.1f}%\n")
-            f.write(f"Execution Time: {summary['total_execution_time']:.2f}s\n\n")
-            
-            f.write("Category Results:\n")
-            f.write("-" * 30 + "\n")
-            for category, result in results.items():
-                status = "✅ PASS" if result.get("success", False) else "❌ FAIL"
-                f.write(f"{category}: {status}\n")
+        # Serialization and file writes block, so keep them off the event loop
+        await asyncio.to_thread(
+            self._write_reports_sync, report_file, summary_file, full_report, summary,
+            local_now.strftime("%Y-%m-%d %H:%M:%S")
+        )
         
         print(f"\n📄 Detailed report saved to: {report_file}")
         print(f"📋 Summary saved to: {summary_file}")
+    
+    def _write_reports_sync(self, report_file: Path, summary_file: Path,
+                            full_report: Dict[str, Any], summary: Dict[str, Any],
+                            generated: str):
+        """Write the JSON report and the human-readable summary."""
+        # Build each payload in memory so every file is a single write
+        if orjson is not None:
+            report_bytes = orjson.dumps(
+                full_report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            report_bytes = json.dumps(full_report, indent=2).encode()
+        report_file.write_bytes(report_bytes)
+        
+        # Save human-readable summary
+        lines = [
+            "ComfyUI Launcher Recovery Test Summary",
+            "=" * 50,
+            "",
+            f"Generated: {generated}",
+            f"Total Tests: {summary['total_tests']}",
+            f"Passed Tests: {summary['passed_tests']}",
+            f"Failed Tests: {summary['failed_tests']}",
+            f"Success Rate: {summary['success_rate']:.1f}%",
+            f"Execution Time: {summary['total_execution_time']:.2f}s",
+            "",
+            "Category Results:",
+            "-" * 30,
+        ]
+        for category, result in full_report["detailed_results"].items():
+            status = "✅ PASS" if result.get("success", False) else "❌ FAIL"
+            lines.append(f"{category}: {status}")
+        summary_bytes = ("\n".join(lines) + "\n").encode()
+        summary_file.write_bytes(summary_bytes)
+
+
+def _entrypoint(method_name: str, config: Dict[str, Any], verbose: bool) -> Dict[str, Any]:
+    """Run one TestRunner suite in a worker process (top-level so it pickles)."""
+    runner = TestRunner(verbose=verbose)
+    runner.config = MappingProxyType(config)
+    return asyncio.run(getattr(runner, method_name)())
 
 
 class ParallelTestRunner:
@@ -337,31 +483,44 @@ class ParallelTestRunner:
     
     def __init__(self, max_workers: int = None):
         self.max_workers = max_workers or multiprocessing.cpu_count()
+        # One pool for the whole run so worker start-up is paid once
+        self._pool = ProcessPoolExecutor(self.max_workers)
+    
+    async def __aenter__(self) -> "ParallelTestRunner":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close()
     
-    async def run_tests_parallel(self, test_functions: List[callable]) -> List[Dict[str, Any]]:
-        """Run multiple test functions in parallel."""
-        print(f"🔄 Running {len(test_functions)} test suites in parallel")
+    def close(self):
+        """Shut down the worker pool."""
+        self._pool.shutdown()
+    
+    async def run_tests_parallel(self, test_names: List[str], config: Dict[str, Any],
+                                 verbose: bool = False) -> List[Dict[str, Any]]:
+        """Run multiple TestRunner suites, by method name, in worker processes."""
+        print(f"🔄 Running {len(test_names)} test suites in parallel")
         print(f"🔧 Using {self.max_workers} workers\n")
         
-        semaphore = asyncio.Semaphore(self.max_workers)
-        tasks = []
-        
-        async def run_with_semaphore(test_func, test_name):
-            async with semaphore:
-                print(f"🚀 Starting {test_name}")
-                try:
-                    result = await test_func()
-                    print(f"✅ Completed {test_name}")
-                    return {"test_name": test_name, "result": result, "success": True}
-                except Exception as e:
-                    print(f"❌ Failed {test_name}: {e}")
-                    return {"test_name": test_name, "error": str(e), "success": False}
+        loop = asyncio.get_running_loop()
+        config = dict(config)
         
-        for test_func in test_functions:
-            test_name = test_func.__name__
-            tasks.append(run_with_semaphore(test_func, test_name))
+        async def run_in_pool(test_name):
+            print(f"🚀 Starting {test_name}")
+            try:
+                result = await loop.run_in_executor(
+                    self._pool, _entrypoint, test_name, config, verbose
+                )
+                print(f"✅ Completed {test_name}")
+                return {"test_name": test_name, "result": result, "success": True}
+            except Exception as e:
+                print(f"❌ Failed {test_name}: {e}")
+                return {"test_name": test_name, "error": str(e), "success": False}
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(run_in_pool(test_name) for test_name in test_names),
+            return_exceptions=True
+        )
         
         return [r for r in results if isinstance(r, dict)]
 
@@ -412,7 +571,8 @@ Examples:
     
     parser.add_argument(
         "--report", action="store_true",
-        help="Generate detailed test report"
+        help="Save detailed JSON and text reports to the report directory "
+             "(unit test logs are written there regardless)"
     )
     
     parser.add_argument(
@@ -432,7 +592,7 @@ Examples:
     
     parser.add_argument(
         "--verbose", "-v", action="store_true",
-        help="Verbose output"
+        help="Verbose output (pytest -v for unit tests)"
     )
     
     return parser
@@ -448,11 +608,11 @@ async def main():
         args.all = True
     
     # Create test runner
-    runner = TestRunner()
+    runner = TestRunner(verbose=args.verbose)
     
     # Override config with command line arguments
     if args.config:
-        runner.config.update(json.load(open(args.config)))
+        runner.config.update(_load_config_file(args.config))
     
     if args.timeout:
         runner.config["test_timeout"] = args.timeout
@@ -460,34 +620,38 @@ async def main():
     if args.workers:
         runner.config["parallel_workers"] = args.workers
     
+    # Configuration is final from here on; share it read-only
+    runner.config = MappingProxyType(runner.config)
+    
     # Run selected tests
     if args.all:
-        results = await runner.run_all_tests()
+        results = await runner.run_all_tests(save_report=args.report)
     
     elif args.parallel:
         # Run tests in parallel
-        parallel_runner = ParallelTestRunner(runner.config["parallel_workers"])
-        
-        test_functions = [
-            runner._run_unit_tests,
-            runner._run_integration_tests,
-            runner._run_e2e_tests,
-            runner._run_performance_tests
+        test_names = [
+            "_run_unit_tests",
+            "_run_integration_tests",
+            "_run_e2e_tests",
+            "_run_performance_tests"
         ]
         
-        parallel_results = await parallel_runner.run_tests_parallel(test_functions)
+        async with ParallelTestRunner(runner.config["parallel_workers"]) as parallel_runner:
+            parallel_results = await parallel_runner.run_tests_parallel(
+                test_names, runner.config, verbose=args.verbose
+            )
         
         # Process parallel results
         all_results = {}
-        total_time = 0
+        acc = SummaryAcc()
         
         for result in parallel_results:
             if result["success"]:
                 test_name = result["test_name"].replace("_run_", "").replace("_tests", "")
                 all_results[test_name.title() + " Tests"] = result["result"]
-                total_time += result["result"].get("execution_time", 0)
+                acc.add(result["result"])
         
-        summary = runner._generate_summary(all_results, total_time)
+        summary = runner._generate_summary(acc, all_results)
         runner._print_summary(summary)
         
         if args.report:
@@ -496,34 +660,34 @@ async def main():
     else:
         # Run specific test types
         results = {}
-        total_time = 0
+        acc = SummaryAcc()
         
         if args.unit:
             print("🧪 Running Unit Tests")
             result = await runner._run_unit_tests()
             results["Unit Tests"] = result
-            total_time += result.get("execution_time", 0)
+            acc.add(result)
         
         if args.integration:
             print("🔗 Running Integration Tests")
             result = await runner._run_integration_tests()
             results["Integration Tests"] = result
-            total_time += result.get("execution_time", 0)
+            acc.add(result)
         
         if args.e2e:
             print("🎯 Running End-to-End Tests")
             result = await runner._run_e2e_tests()
             results["End-to-End Tests"] = result
-            total_time += result.get("execution_time", 0)
+            acc.add(result)
         
         if args.performance:
             print("⚡ Running Performance Tests")
             result = await runner._run_performance_tests()
             results["Performance Tests"] = result
-            total_time += result.get("execution_time", 0)
+            acc.add(result)
         
         if results:
-            summary = runner._generate_summary(results, total_time)
+            summary = runner._generate_summary(acc, results)
             runner._print_summary(summary)
             
             if args.report:
@@ -5,15 +5,35 @@ Validates that performance requirements are met (<5% overhead).
 """
 
 import asyncio
+import contextvars
 import time
-import statistics
 import json
 import sys
 import os
+import tracemalloc
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is missing: leave the function as plain Python."""
+        return lambda func: func
+
 # Add the recovery module path
 sys.path.insert(0, '/home/crogers2287/comfy/ComfyUI-Launcher/worktrees/issue-8/backend/src')
 
@@ -26,8 +46,59 @@ except ImportError as e:
     RECOVERY_AVAILABLE = False
     sys.exit(1)
 
+# Upper bound on timed operations in flight at once
+MAX_CONCURRENCY = 64
+
+
+@njit(cache=True)
+def _score(overheads, memory_mb, failed, total):
+    """Overall performance score (0-100) from per-test overhead percentages."""
+    avg_overhead = overheads.mean() if overheads.size else 0.0
+    penalty = (
+        min(50.0, avg_overhead * 10)
+        + min(25.0, memory_mb * 5)
+        + failed / total * 25
+    )
+    return max(0.0, 100.0 - penalty)
+
+
+# Compile (or load the cached kernel) now rather than during the first report
+_score(np.zeros(1), 0.0, 0, 1)
+
+# Synthetic work per operation: a fixed CPU loop (~1ms) instead of a 1ms sleep,
+# whose real duration depends on timer resolution. The operations do not
+# yield, so a concurrent batch cannot fold other operations' work into
+# each timing
+SPIN_ITERATIONS = 25000
+
+
+def _spin(n: int) -> int:
+    """Do a fixed amount of interpreter work."""
+    s = 0
+    for _ in range(n):
+        s += 1
+    return s
 
-@dataclass
+
+# Decorated once at import rather than on every measure_* call
+@recoverable(max_retries=2, initial_delay=0.01)
+async def _checkpoint_operation(op_id: int):
+    # Simulate work that might need checkpointing
+    await asyncio.sleep(0.01)
+    return {"op_id": op_id, "status": "success"}
+
+
+@recoverable(max_retries=3, initial_delay=0.01)
+async def _failing_operation(op_id: int, should_fail: bool):
+    # Failures are decided up front by the caller's failure mask
+    if should_fail:
+        raise ConnectionError("Simulated failure for %d" % op_id)
+    
+    await asyncio.sleep(0.02)
+    return {"op_id": op_id, "status": "success"}
+
+
+@dataclass(slots=True, frozen=True)
 class PerformanceResult:
     """Result of a performance test."""
     test_name: str
@@ -37,6 +108,17 @@ class PerformanceResult:
     within_threshold: bool
     iterations: int
     details: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary entry for this result, with times in milliseconds."""
+        return {
+            "test_name": self.test_name,
+            "baseline_time_ms": self.baseline_time * 1000,
+            "recovery_time_ms": self.recovery_time * 1000,
+            "overhead_percent": self.overhead_percent,
+            "within_threshold": self.within_threshold,
+            "details": self.details
+        }
 
 
 class PerformanceValidator:
@@ -45,28 +127,20 @@ class PerformanceValidator:
     def __init__(self, max_overhead_percent: float = 5.0):
         self.max_overhead_percent = max_overhead_percent
         self.results: List[PerformanceResult] = []
+        # (iterations, pending or finished baseline run) shared across measurements
+        self._baseline: Optional[Tuple[int, float]] = None
     
     async def measure_decorator_overhead(self, iterations: int = 1000) -> PerformanceResult:
         """Measure overhead of recovery decorator."""
         print(f"Measuring decorator overhead with {iterations} iterations...")
         
-        # Baseline - no recovery
-        baseline_times = []
-        for i in range(iterations):
-            start = time.perf_counter()
-            await self._baseline_operation(f"op_{i}")
-            baseline_times.append(time.perf_counter() - start)
+        await self._warm_up(iterations, self._baseline_operation, self._decorated_operation)
         
-        baseline_avg = statistics.mean(baseline_times)
+        # Baseline - no recovery
+        baseline_avg = await self._measure_baseline(iterations)
         
         # With recovery (no retries)
-        recovery_times = []
-        for i in range(iterations):
-            start = time.perf_counter()
-            await self._decorated_operation(f"op_{i}")
-            recovery_times.append(time.perf_counter() - start)
-        
-        recovery_avg = statistics.mean(recovery_times)
+        recovery_avg, _ = await self._run_timed(self._decorated_operation, iterations)
         overhead_percent = ((recovery_avg - baseline_avg) / baseline_avg) * 100
         
         result = PerformanceResult(
@@ -86,32 +160,17 @@ class PerformanceValidator:
         """Measure checkpoint performance."""
         print(f"Measuring checkpoint performance with {iterations} iterations...")
         
-        checkpoint_times = []
-        
-        @recoverable(max_retries=2, initial_delay=0.01)
-        async def checkpoint_operation(op_id: str):
-            # Simulate work that might need checkpointing
-            await asyncio.sleep(0.01)
-            return {"op_id": op_id, "status": "success"}
+        await self._warm_up(iterations, self._baseline_operation, _checkpoint_operation)
         
-        for i in range(iterations):
-            start = time.perf_counter()
-            try:
-                result = await checkpoint_operation(f"checkpoint_{i}")
-            except Exception:
-                pass  # Continue even if operation fails
-            checkpoint_times.append(time.perf_counter() - start)
-        
-        avg_checkpoint_time = statistics.mean(checkpoint_times)
+        # Failed operations are still timed; the run continues regardless.
+        # Checkpoints sleep, so they run one at a time to keep other
+        # operations' work out of each sample
+        avg_checkpoint_time, _ = await self._run_timed(
+            _checkpoint_operation, iterations, concurrency=1
+        )
         
         # Simulate baseline for comparison
-        baseline_times = []
-        for i in range(iterations):
-            start = time.perf_counter()
-            await self._baseline_operation(f"baseline_{i}")
-            baseline_times.append(time.perf_counter() - start)
-        
-        baseline_avg = statistics.mean(baseline_times)
+        baseline_avg = await self._measure_baseline(iterations)
         overhead_percent = ((avg_checkpoint_time - baseline_avg) / baseline_avg) * 100
         
         result = PerformanceResult(
@@ -131,37 +190,24 @@ class PerformanceValidator:
         """Measure actual recovery performance."""
         print(f"Measuring recovery performance with {iterations} iterations...")
         
-        recovery_times = []
-        success_count = 0
-        
-        @recoverable(max_retries=3, initial_delay=0.01)
-        async def failing_operation(op_id: str):
-            # Simulate failure 40% of the time
-            if hash(op_id) % 10 < 4:  # 40% failure rate
-                raise ConnectionError(f"Simulated failure for {op_id}")
-            
-            await asyncio.sleep(0.02)
-            return {"op_id": op_id, "status": "success"}
-        
-        for i in range(iterations):
-            start = time.perf_counter()
-            try:
-                result = await failing_operation(f"recovery_{i}")
-                success_count += 1
-            except Exception:
-                pass  # Expected failures
-            recovery_times.append(time.perf_counter() - start)
-        
-        avg_recovery_time = statistics.mean(recovery_times)
+        # Warm up with succeeding calls only, so the circuit breaker is untouched
+        await self._warm_up(
+            iterations, self._baseline_operation,
+            lambda op_id: _failing_operation(op_id, False)
+        )
         
-        # Simulate baseline for comparison
-        baseline_times = []
-        for i in range(iterations):
-            start = time.perf_counter()
-            await self._baseline_operation(f"baseline_{i}")
-            baseline_times.append(time.perf_counter() - start)
+        # Seeded 40% failure mask: reproducible across runs
+        fails = np.random.default_rng(42).random(iterations) < 0.4
+        # Exhausted retries are expected failures and only lower success_count.
+        # Run serially: the operations share one circuit breaker, and a burst of
+        # concurrent failures would open it and reject the ops not yet started
+        avg_recovery_time, success_count = await self._run_timed(
+            lambda op_id: _failing_operation(op_id, fails[op_id]), iterations,
+            concurrency=1
+        )
         
-        baseline_avg = statistics.mean(baseline_times)
+        # Simulate baseline for comparison
+        baseline_avg = await self._measure_baseline(iterations)
         overhead_percent = ((avg_recovery_time - baseline_avg) / baseline_avg) * 100
         
         success_rate = (success_count / iterations) * 100
@@ -179,58 +225,107 @@ class PerformanceValidator:
         self.results.append(result)
         return result
     
-    async def _baseline_operation(self, op_id: str):
+    async def _measure_baseline(self, iterations: int) -> float:
+        """Mean baseline operation time, reusing an earlier measurement.
+        
+        A baseline taken with at least as many iterations is reused instead
+        of being measured again.
+        """
+        if self._baseline is None or self._baseline[0] < iterations:
+            baseline_avg, _ = await self._run_timed(self._baseline_operation, iterations)
+            self._baseline = (iterations, baseline_avg)
+        return self._baseline[1]
+    
+    async def _warm_up(self, iterations: int, *operations: Callable):
+        """Run untimed calls of each operation to absorb first-call costs."""
+        count = min(50, iterations // 10)
+        for operation in operations:
+            await asyncio.gather(
+                *(operation(op_id) for op_id in range(count)), return_exceptions=True
+            )
+    
+    async def _run_timed(self, operation: Callable, iterations: int,
+                         concurrency: int = MAX_CONCURRENCY) -> Tuple[float, int]:
+        """Time operation(op_id) for each op_id in range(iterations) concurrently.
+        
+        At most ``concurrency`` calls are in flight; 1 runs them serially in
+        op_id order. Returns the mean call duration in seconds and how many
+        calls succeeded. Durations are summed as they complete rather than
+        kept per call.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        total_ns = 0
+        
+        # The clock is bound as a default so the timed region does a fast
+        # local load instead of a global plus attribute lookup per read
+        async def timed(op_id: int, *, _clock=time.perf_counter_ns) -> bool:
+            nonlocal total_ns
+            async with semaphore:
+                start = _clock()
+                try:
+                    await operation(op_id)
+                    succeeded = True
+                except Exception:
+                    succeeded = False
+                total_ns += _clock() - start
+                return succeeded
+        
+        # The operations use no context variables, so every task shares one
+        # empty Context rather than copying the caller's per task
+        loop = asyncio.get_running_loop()
+        context = contextvars.Context()
+        outcomes = await asyncio.gather(*(
+            loop.create_task(timed(op_id), context=context) for op_id in range(iterations)
+        ))
+        return total_ns / iterations * 1e-9, sum(outcomes)
+    
+    async def _baseline_operation(self, op_id: int):
         """Baseline operation without recovery."""
-        await asyncio.sleep(0.001)  # Simulate work
+        _spin(SPIN_ITERATIONS)  # Simulate work
         return {"op_id": op_id, "status": "success"}
     
     @recoverable(max_retries=0)
-    async def _decorated_operation(self, op_id: str):
+    async def _decorated_operation(self, op_id: int):
         """Operation with recovery decorator (no retries)."""
-        await asyncio.sleep(0.001)  # Simulate work
+        _spin(SPIN_ITERATIONS)  # Simulate work
         return {"op_id": op_id, "status": "success"}
     
     async def measure_memory_usage(self) -> Dict[str, Any]:
         """Measure memory usage impact."""
         print("Measuring memory usage impact...")
         
-        try:
-            import tracemalloc
-            import psutil
-            
-            # Measure baseline memory
-            tracemalloc.start()
-            baseline_current, baseline_peak = tracemalloc.get_traced_memory()
-            
-            # Run operations with recovery
-            for i in range(100):
-                await self._decorated_operation(f"mem_test_{i}")
-            
-            # Measure memory after recovery operations
-            recovery_current, recovery_peak = tracemalloc.get_traced_memory()
-            tracemalloc.stop()
-            
-            # Calculate memory overhead
-            memory_overhead_mb = (recovery_peak - baseline_peak) / (1024 * 1024)
-            
-            return {
-                "baseline_memory_mb": baseline_peak / (1024 * 1024),
-                "recovery_memory_mb": recovery_peak / (1024 * 1024),
-                "memory_overhead_mb": memory_overhead_mb,
-                "within_threshold": memory_overhead_mb < 5.0,  # < 5MB requirement
-                "memory_efficiency_score": max(0, 100 - memory_overhead_mb * 20)  # 1MB = 20 point penalty
-            }
-            
-        except ImportError:
-            print("Memory profiling not available (missing psutil/tracemalloc)")
-            return {
-                "baseline_memory_mb": 0,
-                "recovery_memory_mb": 0,
-                "memory_overhead_mb": 0,
-                "within_threshold": True,
-                "memory_efficiency_score": 100,
-                "note": "Memory profiling not available"
-            }
+        # Measure baseline memory under the same loop as the recovery run,
+        # so the harness's own allocations appear on both sides
+        tracemalloc.start()
+        for i in range(100):
+            await self._baseline_operation(i)
+        baseline_current, baseline_peak = tracemalloc.get_traced_memory()
+        # One snapshot per phase boundary, diffed once at the end
+        before_recovery = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        
+        # Run operations with recovery
+        for i in range(100):
+            await self._decorated_operation(i)
+        
+        # Measure memory after recovery operations
+        recovery_current, recovery_peak = tracemalloc.get_traced_memory()
+        after_recovery = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        
+        # Calculate memory overhead
+        memory_overhead_mb = (recovery_peak - baseline_peak) / (1024 * 1024)
+        retained = after_recovery.compare_to(before_recovery, "lineno")
+        retained_mb = sum(stat.size_diff for stat in retained) / (1024 * 1024)
+        
+        return {
+            "baseline_memory_mb": baseline_peak / (1024 * 1024),
+            "recovery_memory_mb": recovery_peak / (1024 * 1024),
+            "memory_overhead_mb": memory_overhead_mb,
+            "retained_memory_mb": retained_mb,
+            "within_threshold": memory_overhead_mb < 5.0,  # < 5MB requirement
+            "memory_efficiency_score": max(0, 100 - memory_overhead_mb * 20)  # 1MB = 20 point penalty
+        }
     
     def get_summary(self) -> Dict[str, Any]:
         """Get performance validation summary."""
@@ -241,9 +336,11 @@ class PerformanceValidator:
         passed_tests = len([r for r in self.results if r.within_threshold])
         failed_tests = len([r for r in self.results if not r.within_threshold])
         
-        overhead_percentages = [r.overhead_percent for r in self.results]
-        avg_overhead = statistics.mean(overhead_percentages) if overhead_percentages else 0
-        max_overhead = max(overhead_percentages) if overhead_percentages else 0
+        overhead_percentages = np.fromiter(
+            (r.overhead_percent for r in self.results), np.float64, len(self.results)
+        )
+        avg_overhead = float(overhead_percentages.mean())
+        max_overhead = float(overhead_percentages.max())
         
         return {
             "total_tests": total_tests,
@@ -253,25 +350,28 @@ class PerformanceValidator:
             "average_overhead_percent": avg_overhead,
             "maximum_overhead_percent": max_overhead,
             "meets_requirements": avg_overhead <= self.max_overhead_percent,
-            "test_results": [
-                {
-                    "test_name": r.test_name,
-                    "baseline_time_ms": r.baseline_time * 1000,
-                    "recovery_time_ms": r.recovery_time * 1000,
-                    "overhead_percent": r.overhead_percent,
-                    "within_threshold": r.within_threshold,
-                    "details": r.details
-                }
-                for r in self.results
-            ]
+            "test_results": [r.to_dict() for r in self.results]
         }
 
 
+# (value getter, threshold, message) for each recommendation; the message is
+# added when the value from (summary, memory_results) exceeds the threshold
+RECOMMENDATION_CHECKS = (
+    (lambda summary, memory: summary.get("average_overhead_percent", 0), 5.0,
+     "Reduce overhead from {:.2f}% to below 5%"),
+    (lambda summary, memory: memory.get("memory_overhead_mb", 0), 5.0,
+     "Reduce memory overhead from {:.2f}MB to below 5MB"),
+    (lambda summary, memory: summary.get("failed_tests", 0), 0,
+     "Address {} failing performance tests"),
+)
+
+
 class PerformanceReportGenerator:
     """Generate comprehensive performance report."""
     
     def __init__(self):
         self.timestamp = datetime.now(timezone.utc)
+        self.timestamp_iso = self.timestamp.isoformat()
     
     def generate_report(self, validator: PerformanceValidator, memory_results: Dict[str, Any]) -> Dict[str, Any]:
         """Generate comprehensive performance report."""
@@ -281,7 +381,7 @@ class PerformanceReportGenerator:
         performance_score = self._calculate_performance_score(summary, memory_results)
         
         return {
-            "report_timestamp": self.timestamp.isoformat(),
+            "report_timestamp": self.timestamp_iso,
             "requirements": {
                 "max_overhead_percent": 5.0,
                 "max_memory_overhead_mb": 5.0,
@@ -304,23 +404,16 @@ class PerformanceReportGenerator:
     
     def _calculate_performance_score(self, summary: Dict[str, Any], memory_results: Dict[str, Any]) -> float:
         """Calculate overall performance score (0-100)."""
-        score = 100.0
-        
-        # Penalize for overhead
-        overhead_penalty = min(50, summary.get("average_overhead_percent", 0) * 10)
-        score -= overhead_penalty
-        
-        # Penalize for memory usage
-        memory_penalty = min(25, memory_results.get("memory_overhead_mb", 0) * 5)
-        score -= memory_penalty
-        
-        # Penalize for failed tests
-        failed_tests = summary.get("failed_tests", 0)
-        total_tests = summary.get("total_tests", 1)
-        failure_penalty = (failed_tests / total_tests) * 25
-        score -= failure_penalty
-        
-        return max(0, score)
+        # Penalties for overhead, memory usage and failed tests
+        overheads = np.fromiter(
+            (r["overhead_percent"] for r in summary.get("test_results", ())), np.float64
+        )
+        return float(_score(
+            overheads,
+            float(memory_results.get("memory_overhead_mb", 0)),
+            summary.get("failed_tests", 0),
+            summary.get("total_tests", 1)
+        ))
     
     def _get_grade(self, score: float) -> str:
         """Get performance grade based on score."""
@@ -339,17 +432,10 @@ class PerformanceReportGenerator:
         """Generate recommendations based on results."""
         recommendations = []
         
-        avg_overhead = summary.get("average_overhead_percent", 0)
-        if avg_overhead > 5.0:
-            recommendations.append(f"Reduce overhead from {avg_overhead:.2f}% to below 5%")
-        
-        memory_overhead = memory_results.get("memory_overhead_mb", 0)
-        if memory_overhead > 5.0:
-            recommendations.append(f"Reduce memory overhead from {memory_overhead:.2f}MB to below 5MB")
-        
-        failed_tests = summary.get("failed_tests", 0)
-        if failed_tests > 0:
-            recommendations.append(f"Address {failed_tests} failing performance tests")
+        for getter, threshold, template in RECOMMENDATION_CHECKS:
+            value = getter(summary, memory_results)
+            if value > threshold:
+                recommendations.append(template.format(value))
         
         if not recommendations:
             recommendations.append("Performance requirements are met. Continue monitoring.")
@@ -358,68 +444,73 @@ class PerformanceReportGenerator:
     
     def print_report(self, report: Dict[str, Any]):
         """Print formatted performance report."""
-        print("\n" + "=" * 70)
-        print("COMFYUI LAUNCHER RECOVERY SYSTEM PERFORMANCE VALIDATION REPORT")
-        print("=" * 70)
-        print(f"Generated: {report['report_timestamp']}")
-        print()
+        # Collect lines and emit them in one write
+        out = []
+        out.append("\n" + "=" * 70)
+        out.append("COMFYUI LAUNCHER RECOVERY SYSTEM PERFORMANCE VALIDATION REPORT")
+        out.append("=" * 70)
+        out.append(f"Generated: {report['report_timestamp']}")
+        out.append("")
         
         # Overall assessment
         assessment = report["overall_assessment"]
-        print("OVERALL ASSESSMENT:")
-        print(f"  Performance Score: {assessment['performance_score']:.1f}/100")
-        print(f"  Grade: {assessment['grade']}")
-        print(f"  Meets All Requirements: {assessment['meets_all_requirements']}")
-        print()
+        out.append("OVERALL ASSESSMENT:")
+        out.append(f"  Performance Score: {assessment['performance_score']:.1f}/100")
+        out.append(f"  Grade: {assessment['grade']}")
+        out.append(f"  Meets All Requirements: {assessment['meets_all_requirements']}")
+        out.append("")
         
         # Requirements
-        print("PERFORMANCE REQUIREMENTS:")
+        out.append("PERFORMANCE REQUIREMENTS:")
         reqs = report["requirements"]
-        print(f"  • Max Overhead: {reqs['max_overhead_percent']}%")
-        print(f"  • Max Memory Overhead: {reqs['max_memory_overhead_mb']}MB")
-        print(f"  • Min Success Rate: {reqs['min_success_rate_percent']}%")
-        print(f"  • Max Checkpoint Time: {reqs['max_checkpoint_time_ms']}ms")
-        print(f"  • Max Recovery Time: {reqs['max_recovery_time_ms']}ms")
-        print()
+        out.append(f"  • Max Overhead: {reqs['max_overhead_percent']}%")
+        out.append(f"  • Max Memory Overhead: {reqs['max_memory_overhead_mb']}MB")
+        out.append(f"  • Min Success Rate: {reqs['min_success_rate_percent']}%")
+        out.append(f"  • Max Checkpoint Time: {reqs['max_checkpoint_time_ms']}ms")
+        out.append(f"  • Max Recovery Time: {reqs['max_recovery_time_ms']}ms")
+        out.append("")
         
         # Summary
         summary = report["performance_summary"]
-        print("TEST SUMMARY:")
-        print(f"  Total Tests: {summary['total_tests']}")
-        print(f"  Passed Tests: {summary['passed_tests']}")
-        print(f"  Failed Tests: {summary['failed_tests']}")
-        print(f"  Success Rate: {summary['success_rate']:.1f}%")
-        print(f"  Average Overhead: {summary['average_overhead_percent']:.2f}%")
-        print(f"  Maximum Overhead: {summary['maximum_overhead_percent']:.2f}%")
-        print(f"  Meets Requirements: {summary['meets_requirements']}")
-        print()
+        out.append("TEST SUMMARY:")
+        out.append(f"  Total Tests: {summary['total_tests']}")
+        out.append(f"  Passed Tests: {summary['passed_tests']}")
+        out.append(f"  Failed Tests: {summary['failed_tests']}")
+        out.append(f"  Success Rate: {summary['success_rate']:.1f}%")
+        out.append(f"  Average Overhead: {summary['average_overhead_percent']:.2f}%")
+        out.append(f"  Maximum Overhead: {summary['maximum_overhead_percent']:.2f}%")
+        out.append(f"  Meets Requirements: {summary['meets_requirements']}")
+        out.append("")
         
         # Memory results
         memory = report["memory_results"]
-        print("MEMORY USAGE:")
-        print(f"  Baseline Memory: {memory['baseline_memory_mb']:.2f}MB")
-        print(f"  Recovery Memory: {memory['recovery_memory_mb']:.2f}MB")
-        print(f"  Memory Overhead: {memory['memory_overhead_mb']:.2f}MB")
-        print(f"  Memory Efficiency Score: {memory['memory_efficiency_score']:.1f}/100")
-        print(f"  Within Threshold: {memory['within_threshold']}")
-        print()
+        out.append("MEMORY USAGE:")
+        out.append(f"  Baseline Memory: {memory['baseline_memory_mb']:.2f}MB")
+        out.append(f"  Recovery Memory: {memory['recovery_memory_mb']:.2f}MB")
+        out.append(f"  Memory Overhead: {memory['memory_overhead_mb']:.2f}MB")
+        out.append(f"  Retained Memory: {memory['retained_memory_mb']:.2f}MB")
+        out.append(f"  Memory Efficiency Score: {memory['memory_efficiency_score']:.1f}/100")
+        out.append(f"  Within Threshold: {memory['within_threshold']}")
+        out.append("")
         
         # Detailed results
-        print("DETAILED TEST RESULTS:")
+        out.append("DETAILED TEST RESULTS:")
         for result in summary["test_results"]:
             status = "✓" if result["within_threshold"] else "✗"
-            print(f"  {status} {result['test_name']}:")
-            print(f"    Baseline: {result['baseline_time_ms']:.3f}ms")
-            print(f"    Recovery: {result['recovery_time_ms']:.3f}ms")
-            print(f"    Overhead: {result['overhead_percent']:.2f}%")
-            print(f"    Details: {result['details']}")
-            print()
+            out.append(f"  {status} {result['test_name']}:")
+            out.append(f"    Baseline: {result['baseline_time_ms']:.3f}ms")
+            out.append(f"    Recovery: {result['recovery_time_ms']:.3f}ms")
+            out.append(f"    Overhead: {result['overhead_percent']:.2f}%")
+            out.append(f"    Details: {result['details']}")
+            out.append("")
         
         # Recommendations
-        print("RECOMMENDATIONS:")
+        out.append("RECOMMENDATIONS:")
         for i, rec in enumerate(assessment["recommendations"], 1):
-            print(f"  {i}. {rec}")
-        print()
+            out.append(f"  {i}. {rec}")
+        out.append("")
+        
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 async def main():
@@ -457,8 +548,12 @@ async def main():
         
         # Save report to file
         report_file = "/home/crogers2287/comfy/ComfyUI-Launcher/worktrees/issue-8/performance_validation_report.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
         print(f"Report saved to: {report_file}")
         
         # Return success status
@@ -472,5 +567,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    # Use the libuv-based loop when available for cheaper task scheduling
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        success = runner.run(main())
     sys.exit(0 if success else 1)
\ No newline at end of file